@@ -309,20 +309,24 @@ def pixelCoordsFromPupilCoords(xPupil, yPupil, chipNames=None,
     if chipNames is None:
         chipNames = chipNameFromPupilCoords(xPupil, yPupil, camera=camera)
 
-    xPix = []
-    yPix = []
-    for name, x, y in zip(chipNames, xPupil, yPupil):
+    # look up each detector's pixel coordinate system once, rather than
+    # once per point (most points share a handful of detectors)
+    pixelSystemDict = {}
+    for name in chipNames:
+        if name not in pixelSystemDict and name is not None and name!='None':
+            pixelSystemDict[name] = camera[name].makeCameraSys(pixelType)
+
+    pixOut = numpy.empty((2, len(xPupil)))
+    for ix, (name, x, y) in enumerate(zip(chipNames, xPupil, yPupil)):
         if not name:
-            xPix.append(numpy.nan)
-            yPix.append(numpy.nan)
+            pixOut[0][ix] = numpy.nan
+            pixOut[1][ix] = numpy.nan
             continue
         cp = camera.makeCameraPoint(afwGeom.Point2D(x, y), PUPIL)
-        det = camera[name]
-        cs = det.makeCameraSys(pixelType)
-        detPoint = camera.transform(cp, cs)
-        xPix.append(detPoint.getPoint().getX())
-        yPix.append(detPoint.getPoint().getY())
-    return numpy.array([xPix, yPix])
+        detPoint = camera.transform(cp, pixelSystemDict[name])
+        pixOut[0][ix] = detPoint.getPoint().getX()
+        pixOut[1][ix] = detPoint.getPoint().getY()
+    return pixOut
 
 
 def pupilCoordsFromPixelCoords(xPixList, yPixList, chipNameList, camera=None,
@@ -368,23 +372,19 @@ def pupilCoordsFromPixelCoords(xPixList, yPixList, chipNameList, camera=None,
 
 
 
-    xPupilList = []
-    yPupilList = []
+    pupilOut = numpy.empty((2, len(xPixList)))
 
-    for xPix, yPix, chipName in zip(xPixList, yPixList, chipNameList):
+    for ix, (xPix, yPix, chipName) in enumerate(zip(xPixList, yPixList, chipNameList)):
         if chipName is None or chipName=='None':
-            xPupilList.append(numpy.NaN)
-            yPupilList.append(numpy.NaN)
+            pupilOut[0][ix] = numpy.NaN
+            pupilOut[1][ix] = numpy.NaN
         else:
             pixPoint = camera.makeCameraPoint(afwGeom.Point2D(xPix, yPix), pixelSystemDict[chipName])
             pupilPoint =  camera.transform(pixPoint, pupilSystemDict[chipName]).getPoint()
-            xPupilList.append(pupilPoint.getX())
-            yPupilList.append(pupilPoint.getY())
-
-    xPupilList = numpy.array(xPupilList)
-    yPupilList = numpy.array(yPupilList)
+            pupilOut[0][ix] = pupilPoint.getX()
+            pupilOut[1][ix] = pupilPoint.getY()
 
-    return numpy.array([xPupilList, yPupilList])
+    return pupilOut
 
 
 def raDecFromPixelCoords(xPixList, yPixList, chipNameList, camera=None,
@@ -419,7 +419,9 @@ def raDecFromPixelCoords(xPixList, yPixList, chipNameList, camera=None,
                                    camera=camera, obs_metadata=obs_metadata,
                                    epoch=epoch, includeDistortion=includeDistortion)
 
-    return numpy.degrees(output)
+    # output is freshly allocated by _raDecFromPixelCoords, so the unit
+    # conversion can be done in place rather than copying the array
+    return numpy.degrees(output, out=output)
 
 
 def _raDecFromPixelCoords(xPixList, yPixList, chipNameList, camera=None,
@@ -597,12 +599,11 @@ def focalPlaneCoordsFromPupilCoords(xPupil, yPupil, camera=None):
     if camera is None:
         raise RuntimeError("You cannot calculate focal plane coordinates without specifying a camera")
 
-    xPix = []
-    yPix = []
-    for x, y in zip(xPupil, yPupil):
+    fpOut = numpy.empty((2, len(xPupil)))
+    for ix, (x, y) in enumerate(zip(xPupil, yPupil)):
         cp = camera.makeCameraPoint(afwGeom.Point2D(x, y), PUPIL)
         fpPoint = camera.transform(cp, FOCAL_PLANE)
-        xPix.append(fpPoint.getPoint().getX())
-        yPix.append(fpPoint.getPoint().getY())
+        fpOut[0][ix] = fpPoint.getPoint().getX()
+        fpOut[1][ix] = fpPoint.getPoint().getY()
 
-    return numpy.array([xPix, yPix])
+    return fpOut
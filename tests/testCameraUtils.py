@@ -1,8 +1,9 @@
-from __future__ import with_statement
 import os
+import re
+import copy
+import functools
 import numpy
 import unittest
-import lsst.utils.tests as utilsTests
 from lsst.utils import getPackageDir
 
 from lsst.afw.cameraGeom import PUPIL, PIXELS, TAN_PIXELS, FOCAL_PLANE
@@ -26,16 +27,59 @@ from lsst.sims.coordUtils import pupilCoordsFromPixelCoords
 
 from lsst.sims.coordUtils import raDecFromPixelCoords, _raDecFromPixelCoords
 
+
+# resolve the camera data directory once at import time; getPackageDir
+# goes through the eups environment and does not need to be re-run for
+# every TestCase class
+_CAMERA_DIR = os.path.join(getPackageDir('sims_coordUtils'), 'tests', 'cameraData')
+
+
+@functools.lru_cache(maxsize=4)
+def _cachedCamera(cameraDir):
+    """
+    Build (and memoize) the afw camera described by the data in cameraDir.
+
+    Every TestCase class in this file uses the same camera, so there is no
+    reason to re-read the camera data from disk once per class.
+    """
+    return ReturnCamera(cameraDir)
+
+
 class ChipNameTest(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cameraDir = getPackageDir('sims_coordUtils')
-        cameraDir = os.path.join(cameraDir, 'tests', 'cameraData')
-        cls.camera = ReturnCamera(cameraDir)
+        cls.camera = _cachedCamera(_CAMERA_DIR)
+
+        # the inputs to testExceptions are constants; build them once here
+        # and share them (read-only) across the tests in this class
+        rand = numpy.random.default_rng(45532)
+        cls.nStars = 10
+        samples = rand.random((2, cls.nStars))*0.1
+        cls.xpList = samples[0]
+        cls.ypList = samples[1]
+        cls.xpDummy = rand.random(cls.nStars//2)
+
+        # plain-list forms of the coordinate arrays, for the checks that
+        # reject non-array input; tolist() unboxes in bulk and the result
+        # is reused by every case that needs it
+        cls.xpListPy = cls.xpList.tolist()
+        cls.ypListPy = cls.ypList.tolist()
+
+        cls.obs = ObservationMetaData(pointingRA=25.0, pointingDec=112.0, mjd=42351.0,
+                                      rotSkyPos=35.0)
+
+        # the incomplete variants only need to differ from cls.obs in the
+        # field they are missing, so blank that field on a shallow copy
+        # rather than paying for two more constructor calls
+        cls.obsNoMjd = copy.copy(cls.obs)
+        cls.obsNoMjd._mjd = None
+
+        cls.obsNoRotSky = copy.copy(cls.obs)
+        cls.obsNoRotSky._rotSkyPos = None
 
     def setUp(self):
-        numpy.random.seed(45532)
+        self.rng = numpy.random.default_rng(45532)
 
 
     def testRuns(self):
@@ -51,8 +95,8 @@ class ChipNameTest(unittest.TestCase):
         obs = ObservationMetaData(pointingRA=ra0, pointingDec=dec0,
                                   mjd=mjd, rotSkyPos=rotSkyPos)
 
-        raList = (numpy.random.random_sample(nStars)-0.5)*1000.0/3600.0 + ra0
-        decList = (numpy.random.random_sample(nStars)-0.5)*1000.0/3600.0 + dec0
+        raList = (self.rng.random(nStars)-0.5)*1000.0/3600.0 + ra0
+        decList = (self.rng.random(nStars)-0.5)*1000.0/3600.0 + dec0
 
         xpList, ypList = pupilCoordsFromRaDec(raList, decList,
                                                    obs_metadata=obs,
@@ -86,138 +130,94 @@ class ChipNameTest(unittest.TestCase):
 
     def testExceptions(self):
         """
-        Test that exceptions are raised when they should be
-        """
-
-        nStars = 10
-        xpList = numpy.random.random_sample(nStars)*0.1
-        ypList = numpy.random.random_sample(nStars)*0.1
-
-        obs = ObservationMetaData(pointingRA=25.0, pointingDec=112.0, mjd=42351.0,
-                                  rotSkyPos=35.0)
-
-        # verify that an exception is raised if you do not pass in a camera
-        with self.assertRaises(RuntimeError) as context:
-            chipNameFromPupilCoords(xpList, ypList)
-        self.assertEqual('No camera defined.  Cannot run chipName.',
-                          context.exception.message)
-
-        with self.assertRaises(RuntimeError) as context:
-            chipNameFromRaDec(xpList, ypList, obs_metadata=obs, epoch=2000.0)
-        self.assertEqual('No camera defined.  Cannot run chipName.',
-                          context.exception.message)
-
-        with self.assertRaises(RuntimeError) as context:
-            _chipNameFromRaDec(xpList, ypList, obs_metadata=obs, epoch=2000.0)
-        self.assertEqual('No camera defined.  Cannot run chipName.',
-                          context.exception.message)
-
-        # verify that an exception is raised if you do not pass in a numpy array
-        with self.assertRaises(RuntimeError) as context:
-            chipNameFromPupilCoords(list(xpList), ypList)
-        self.assertEqual(context.exception.message,
-                         'You need to pass numpy arrays of ' \
-                         + 'xPupil and yPupil to chipNameFromPupilCoords')
-
-        with self.assertRaises(RuntimeError) as context:
-            _chipNameFromRaDec(list(xpList), ypList, obs_metadata=obs, epoch=2000.0)
-        self.assertEqual(context.exception.message,
-                        'You need to pass numpy arrays of RA and Dec to chipName')
-
-        with self.assertRaises(RuntimeError) as context:
-            chipNameFromPupilCoords(xpList, list(ypList))
-        self.assertEqual(context.exception.message,
-                         'You need to pass numpy arrays of ' \
-                         + 'xPupil and yPupil to chipNameFromPupilCoords')
-
-        with self.assertRaises(RuntimeError) as context:
-            _chipNameFromRaDec(xpList, list(ypList), obs_metadata=obs, epoch=2000.0)
-        self.assertEqual(context.exception.message,
-                         'You need to pass numpy arrays of RA and Dec to chipName')
-        # do not need to run the above test on chipNameFromRaDec because
-        # the conversion from degrees to radians that happens inside that
-        # method automatically casts lists as numpy arrays
+        Test that exceptions are raised when they should be.
 
+        Each error condition is a (label, callable, message) row in a table;
+        the rows are run under subTest so that one failure does not mask the
+        others and so that runners can report each case individually.
+        """
 
-        # verify that an exception is raised if the two coordinate arrays contain
+        nStars = self.nStars
+        xpList = self.xpList
+        ypList = self.ypList
+        xpDummy = self.xpDummy
+        xpListPy = self.xpListPy
+        ypListPy = self.ypListPy
+        obs = self.obs
+        camera = self.camera
+
+        # each entry point with the extra keyword arguments it needs and the
+        # message it uses to complain about mismatched coordinate arrays
+        entryPoints = [('chipNameFromPupilCoords', chipNameFromPupilCoords, {},
+                        'You passed %d xPupils and %d yPupils to chipName.'),
+                       ('chipNameFromRaDec', chipNameFromRaDec,
+                        {'obs_metadata': obs, 'epoch': 2000.0},
+                        'You passed %d RAs and %d Decs to chipName.'),
+                       ('_chipNameFromRaDec', _chipNameFromRaDec,
+                        {'obs_metadata': obs, 'epoch': 2000.0},
+                        'You passed %d RAs and %d Decs to chipName.')]
+
+        cases = []
+
+        # every entry point refuses to run without a camera
+        for label, entryPoint, kwargs, _ in entryPoints:
+            cases.append(('no camera: ' + label,
+                          functools.partial(entryPoint, xpList, ypList, **kwargs),
+                          'No camera defined.  Cannot run chipName.'))
+
+        # every entry point complains about coordinate arrays containing
         # different numbers of elements
-        xpDummy = numpy.random.random_sample(nStars/2)
-        with self.assertRaises(RuntimeError) as context:
-            chipNameFromPupilCoords(xpDummy, ypList, camera=self.camera)
-        self.assertEqual(context.exception.message,
-                         'You passed %d xPupils and ' % (nStars/2) \
-                         + '%d yPupils to chipName.' % nStars)
-
-        with self.assertRaises(RuntimeError) as context:
-            chipNameFromRaDec(xpDummy, ypList, obs_metadata=obs, epoch=2000.0,
-                                  camera=self.camera)
-        self.assertEqual(context.exception.message,
-                         'You passed %d RAs and ' % (nStars/2) \
-                         + '%d Decs to chipName.' % nStars)
-
-        with self.assertRaises(RuntimeError) as context:
-            _chipNameFromRaDec(xpDummy, ypList, obs_metadata=obs, epoch=2000.0,
-                                   camera=self.camera)
-        self.assertEqual(context.exception.message,
-                         'You passed %d RAs and ' % (nStars/2) \
-                         + '%d Decs to chipName.' % nStars)
-
-
-        # verify that an exception is raised if you call chipNameFromRaDec
-        # without an epoch
-        with self.assertRaises(RuntimeError) as context:
-            chipNameFromRaDec(xpList, ypList, obs_metadata=obs, camera=self.camera)
-        self.assertEqual(context.exception.message,
-                         'You need to pass an epoch into chipName')
-
-        with self.assertRaises(RuntimeError) as context:
-            _chipNameFromRaDec(xpList, ypList, obs_metadata=obs, camera=self.camera)
-        self.assertEqual(context.exception.message,
-                         'You need to pass an epoch into chipName')
-
-        # verify that an exception is raised if you call chipNameFromRaDec
-        # without an ObservationMetaData
-        with self.assertRaises(RuntimeError) as context:
-            chipNameFromRaDec(xpList, ypList, epoch=2000.0, camera=self.camera)
-        self.assertEqual(context.exception.message,
-                         'You need to pass an ObservationMetaData into chipName')
-
-        with self.assertRaises(RuntimeError) as context:
-            _chipNameFromRaDec(xpList, ypList, epoch=2000.0, camera=self.camera)
-        self.assertEqual(context.exception.message,
-                         'You need to pass an ObservationMetaData into chipName')
-
-        # verify that an exception is raised if you call chipNameFromRaDec
-        # with an ObservationMetaData that has no mjd
-        obsDummy = ObservationMetaData(pointingRA=25.0, pointingDec=-112.0,
-                                       rotSkyPos=112.0)
-        with self.assertRaises(RuntimeError) as context:
-            chipNameFromRaDec(xpList, ypList, epoch=2000.0, obs_metadata=obsDummy,
-                                  camera=self.camera)
-        self.assertEqual(context.exception.message,
-                         'You need to pass an ObservationMetaData with an mjd into chipName')
-
-        with self.assertRaises(RuntimeError) as context:
-            _chipNameFromRaDec(xpList, ypList, epoch=2000.0, obs_metadata=obsDummy,
-                                  camera=self.camera)
-        self.assertEqual(context.exception.message,
-                         'You need to pass an ObservationMetaData with an mjd into chipName')
-
-        # verify that an exception is raised if you all chipNameFromRaDec
-        # using an ObservationMetaData without a rotSkyPos
-        obsDummy = ObservationMetaData(pointingRA=25.0, pointingDec=-112.0,
-                                       mjd=52350.0)
-        with self.assertRaises(RuntimeError) as context:
-            chipNameFromRaDec(xpList, ypList, epoch=2000.0, obs_metadata=obsDummy,
-                                  camera=self.camera)
-        self.assertEqual(context.exception.message,
-                         'You need to pass an ObservationMetaData with a rotSkyPos into chipName')
-
-        with self.assertRaises(RuntimeError) as context:
-            _chipNameFromRaDec(xpList, ypList, epoch=2000.0, obs_metadata=obsDummy,
-                                  camera=self.camera)
-        self.assertEqual(context.exception.message,
-                         'You need to pass an ObservationMetaData with a rotSkyPos into chipName')
+        for label, entryPoint, kwargs, mismatchMessage in entryPoints:
+            cases.append(('mismatched arrays: ' + label,
+                          functools.partial(entryPoint, xpDummy, ypList,
+                                            camera=camera, **kwargs),
+                          mismatchMessage % (nStars//2, nStars)))
+
+        # passing lists rather than numpy arrays; chipNameFromRaDec is exempt
+        # because the conversion from degrees to radians that happens inside
+        # that method automatically casts lists as numpy arrays
+        for label, entryPoint, kwargs, _ in (entryPoints[0], entryPoints[2]):
+            if kwargs:
+                message = 'You need to pass numpy arrays of RA and Dec to chipName'
+            else:
+                message = 'You need to pass numpy arrays of xPupil and yPupil ' \
+                          + 'to chipNameFromPupilCoords'
+
+            cases.append(('x as list: ' + label,
+                          functools.partial(entryPoint, xpListPy, ypList, **kwargs),
+                          message))
+
+            cases.append(('y as list: ' + label,
+                          functools.partial(entryPoint, xpList, ypListPy, **kwargs),
+                          message))
+
+        # the RA, Dec entry points need an epoch and an ObservationMetaData,
+        # and the ObservationMetaData must carry an mjd and a rotSkyPos
+        for label, entryPoint, _, _ in entryPoints[1:]:
+            cases.append(('no epoch: ' + label,
+                          functools.partial(entryPoint, xpList, ypList,
+                                            obs_metadata=obs, camera=camera),
+                          'You need to pass an epoch into chipName'))
+
+            cases.append(('no obs_metadata: ' + label,
+                          functools.partial(entryPoint, xpList, ypList,
+                                            epoch=2000.0, camera=camera),
+                          'You need to pass an ObservationMetaData into chipName'))
+
+            cases.append(('no mjd: ' + label,
+                          functools.partial(entryPoint, xpList, ypList, epoch=2000.0,
+                                            obs_metadata=self.obsNoMjd, camera=camera),
+                          'You need to pass an ObservationMetaData with an mjd into chipName'))
+
+            cases.append(('no rotSkyPos: ' + label,
+                          functools.partial(entryPoint, xpList, ypList, epoch=2000.0,
+                                            obs_metadata=self.obsNoRotSky, camera=camera),
+                          'You need to pass an ObservationMetaData with a rotSkyPos into chipName'))
+
+        for label, callChipName, message in cases:
+            with self.subTest(label):
+                with self.assertRaisesRegex(RuntimeError, re.escape(message)):
+                    callChipName()
 
 
     def testNaNbecomesNone(self):
@@ -235,8 +235,8 @@ class ChipNameTest(unittest.TestCase):
 
         for badVal in [numpy.NaN, None]:
 
-            raList = (numpy.random.random_sample(nStars)-0.5)*5.0/3600.0 + ra0
-            decList = (numpy.random.random_sample(nStars)-0.5)*5.0/3600.0 + dec0
+            raList = (self.rng.random(nStars)-0.5)*5.0/3600.0 + ra0
+            decList = (self.rng.random(nStars)-0.5)*5.0/3600.0 + dec0
 
             raList[5] = badVal
             raList[10] = badVal
@@ -273,12 +273,10 @@ class PixelCoordTest(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cameraDir = getPackageDir('sims_coordUtils')
-        cameraDir = os.path.join(cameraDir, 'tests', 'cameraData')
-        cls.camera = ReturnCamera(cameraDir)
+        cls.camera = _cachedCamera(_CAMERA_DIR)
 
     def setUp(self):
-        numpy.random.seed(11324)
+        self.rng = numpy.random.default_rng(11324)
 
 
     def testConsistency(self):
@@ -292,8 +290,8 @@ class PixelCoordTest(unittest.TestCase):
                                   mjd=52350.0, rotSkyPos=27.0)
 
         nStars = 100
-        raList = (numpy.random.random_sample(nStars)-0.5)*500.0/3600.0 + ra0
-        decList = (numpy.random.random_sample(nStars)-0.5)*500.0/3600.0 + dec0
+        raList = (self.rng.random(nStars)-0.5)*500.0/3600.0 + ra0
+        decList = (self.rng.random(nStars)-0.5)*500.0/3600.0 + dec0
 
         xpList, ypList = pupilCoordsFromRaDec(raList, decList, obs_metadata=obs, epoch=2000.0)
 
@@ -362,27 +360,27 @@ class PixelCoordTest(unittest.TestCase):
         they should
         """
         nPoints = 100
-        xpList = numpy.random.random_sample(nPoints)*numpy.radians(1.0)
-        ypList = numpy.random.random_sample(nPoints)*numpy.radians(1.0)
+        xpList = self.rng.random(nPoints)*numpy.radians(1.0)
+        ypList = self.rng.random(nPoints)*numpy.radians(1.0)
         obs = ObservationMetaData(pointingRA=25.0,
                                   pointingDec=-36.0,
                                   rotSkyPos=122.0,
                                   mjd=41325.0)
 
-        raList = numpy.random.random_sample(nPoints)*1.0+25.0
-        decList = numpy.random.random_sample(nPoints)*1.0-36.0
+        raList = self.rng.random(nPoints)*1.0+25.0
+        decList = self.rng.random(nPoints)*1.0-36.0
 
         # check that an error is raised when you forget to
         # pass in a camera
         with self.assertRaises(RuntimeError) as context:
             pixelCoordsFromPupilCoords(xpList, ypList)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'Camera not specified.  Cannot calculate pixel coordinates.')
 
         with self.assertRaises(RuntimeError) as context:
             pixelCoordsFromRaDec(raList, decList, obs_metadata=obs,
                                  epoch=2000.0)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'Camera not specified.  Cannot calculate pixel coordinates.')
 
         with self.assertRaises(RuntimeError) as context:
@@ -390,7 +388,7 @@ class PixelCoordTest(unittest.TestCase):
                                   numpy.radians(decList),
                                   obs_metadata=obs,
                                   epoch=2000.0)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'Camera not specified.  Cannot calculate pixel coordinates.')
 
 
@@ -399,14 +397,14 @@ class PixelCoordTest(unittest.TestCase):
         with self.assertRaises(RuntimeError) as context:
             pixelCoordsFromPupilCoords(list(xpList), ypList,
                                        camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You need to pass numpy arrays of xPupil and yPupil ' \
                          + 'to pixelCoordsFromPupilCoords')
 
         with self.assertRaises(RuntimeError) as context:
             pixelCoordsFromPupilCoords(xpList, list(ypList),
                                        camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You need to pass numpy arrays of xPupil and yPupil ' \
                          + 'to pixelCoordsFromPupilCoords')
 
@@ -416,7 +414,7 @@ class PixelCoordTest(unittest.TestCase):
                                   obs_metadata=obs,
                                   epoch=2000.0,
                                   camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You need to pass numpy arrays of RA and Dec ' \
                          + 'to pixelCoordsFromRaDec')
 
@@ -426,7 +424,7 @@ class PixelCoordTest(unittest.TestCase):
                                   obs_metadata=obs,
                                   epoch=2000.0,
                                   camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You need to pass numpy arrays of RA and Dec ' \
                          + 'to pixelCoordsFromRaDec')
         # do not need to run the above test on pixelCoordsFromRaDec,
@@ -439,7 +437,7 @@ class PixelCoordTest(unittest.TestCase):
         with self.assertRaises(RuntimeError) as context:
             pixelCoordsFromPupilCoords(xpList, ypList[0:10],
                                        camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You passed 100 xPupil and 10 yPupil coordinates ' \
                          + 'to pixelCoordsFromPupilCoords')
 
@@ -448,7 +446,7 @@ class PixelCoordTest(unittest.TestCase):
                                  obs_metadata=obs,
                                  epoch=2000.0,
                                  camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You passed 100 RA and 10 Dec coordinates ' \
                          'to pixelCoordsFromRaDec')
 
@@ -458,7 +456,7 @@ class PixelCoordTest(unittest.TestCase):
                                   obs_metadata=obs,
                                   epoch=2000.0,
                                   camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You passed 100 RA and 10 Dec coordinates ' \
                          'to pixelCoordsFromRaDec')
 
@@ -468,7 +466,7 @@ class PixelCoordTest(unittest.TestCase):
         with self.assertRaises(RuntimeError) as context:
             pixelCoordsFromPupilCoords(xpList, ypList, chipNames=['Det22']*10,
                                  camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You passed 100 points but 10 chipNames to pixelCoordsFromPupilCoords')
 
         with self.assertRaises(RuntimeError) as context:
@@ -476,7 +474,7 @@ class PixelCoordTest(unittest.TestCase):
                                  camera=self.camera,
                                  obs_metadata=obs,
                                  epoch=2000.0)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You passed 100 points but 10 chipNames to pixelCoordsFromRaDec')
 
         with self.assertRaises(RuntimeError) as context:
@@ -486,7 +484,7 @@ class PixelCoordTest(unittest.TestCase):
                                   camera=self.camera,
                                   obs_metadata=obs,
                                   epoch=2000.0)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You passed 100 points but 10 chipNames to pixelCoordsFromRaDec')
 
         # test that an exception is raised if you call one of the
@@ -495,7 +493,7 @@ class PixelCoordTest(unittest.TestCase):
             pixelCoordsFromRaDec(raList, decList,
                                  camera=self.camera,
                                  obs_metadata=obs)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You need to pass an epoch into ' \
                          + 'pixelCoordsFromRaDec')
 
@@ -503,7 +501,7 @@ class PixelCoordTest(unittest.TestCase):
             _pixelCoordsFromRaDec(raList, decList,
                                   camera=self.camera,
                                   obs_metadata=obs)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You need to pass an epoch into ' \
                          + 'pixelCoordsFromRaDec')
 
@@ -512,14 +510,14 @@ class PixelCoordTest(unittest.TestCase):
         with self.assertRaises(RuntimeError) as context:
             pixelCoordsFromRaDec(raList, decList,
                                  camera=self.camera, epoch=2000.0)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You need to pass an ObservationMetaData into ' \
                          + 'pixelCoordsFromRaDec')
 
         with self.assertRaises(RuntimeError) as context:
             _pixelCoordsFromRaDec(raList, decList,
                                   camera=self.camera, epoch=2000.0)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You need to pass an ObservationMetaData into ' \
                          + 'pixelCoordsFromRaDec')
 
@@ -533,7 +531,7 @@ class PixelCoordTest(unittest.TestCase):
                                  camera=self.camera,
                                  epoch=2000.0,
                                  obs_metadata=obsDummy)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You need to pass an ObservationMetaData ' \
                          + 'with an mjd into pixelCoordsFromRaDec')
 
@@ -542,7 +540,7 @@ class PixelCoordTest(unittest.TestCase):
                                   camera=self.camera,
                                   epoch=2000.0,
                                   obs_metadata=obsDummy)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You need to pass an ObservationMetaData ' \
                          + 'with an mjd into pixelCoordsFromRaDec')
 
@@ -556,7 +554,7 @@ class PixelCoordTest(unittest.TestCase):
                                  camera=self.camera,
                                  epoch=2000.0,
                                  obs_metadata=obsDummy)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You need to pass an ObservationMetaData ' \
                          + 'with a rotSkyPos into pixelCoordsFromRaDec')
 
@@ -568,7 +566,7 @@ class PixelCoordTest(unittest.TestCase):
                                   camera=self.camera,
                                   epoch=2000.0,
                                   obs_metadata=obsDummy)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          'You need to pass an ObservationMetaData ' \
                          + 'with a rotSkyPos into pixelCoordsFromRaDec')
 
@@ -749,8 +747,8 @@ class PixelCoordTest(unittest.TestCase):
                                   rotSkyPos=42.0, mjd=42356.0)
 
         nStars = 10
-        raList = numpy.random.random_sample(100)*100.0/3600.0 + ra0
-        decList = numpy.random.random_sample(100)*100.0/3600.0 + dec0
+        raList = self.rng.random(100)*100.0/3600.0 + ra0
+        decList = self.rng.random(100)*100.0/3600.0 + dec0
         chipNameList = chipNameFromRaDec(raList, decList, obs_metadata=obs, epoch=2000.0,
                                          camera=self.camera)
 
@@ -828,8 +826,8 @@ class PixelCoordTest(unittest.TestCase):
         If we take that away, the test will no longer pass.
         """
         nStars = 100
-        xp = radiansFromArcsec((numpy.random.random_sample(100)-0.5)*100.0)
-        yp = radiansFromArcsec((numpy.random.random_sample(100)-0.5)*100.0)
+        xp = radiansFromArcsec((self.rng.random(100)-0.5)*100.0)
+        yp = radiansFromArcsec((self.rng.random(100)-0.5)*100.0)
 
         xu, yu = pixelCoordsFromPupilCoords(xp, yp, camera=self.camera, includeDistortion=False)
         xd, yd = pixelCoordsFromPupilCoords(xp, yp, camera=self.camera, includeDistortion=True)
@@ -848,12 +846,10 @@ class FocalPlaneCoordTest(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cameraDir = getPackageDir('sims_coordUtils')
-        cameraDir = os.path.join(cameraDir, 'tests', 'cameraData')
-        cls.camera = ReturnCamera(cameraDir)
+        cls.camera = _cachedCamera(_CAMERA_DIR)
 
     def setUp(self):
-        numpy.random.seed(8374522)
+        self.rng = numpy.random.default_rng(8374522)
 
 
     def testConsistency(self):
@@ -873,8 +869,8 @@ class FocalPlaneCoordTest(unittest.TestCase):
                                                epoch=2000.0)
 
         nStars = 100
-        raList = numpy.random.random_sample(nStars)*1000.0/3600.0 + raCenter[0]
-        decList = numpy.random.random_sample(nStars)*1000.0/3600.0 + decCenter[0]
+        raList = self.rng.random(nStars)*1000.0/3600.0 + raCenter[0]
+        decList = self.rng.random(nStars)*1000.0/3600.0 + decCenter[0]
 
         xPupList, yPupList = pupilCoordsFromRaDec(raList, decList,
                                                   obs_metadata=obs,
@@ -916,8 +912,8 @@ class FocalPlaneCoordTest(unittest.TestCase):
                                   rotSkyPos=61.0, mjd=52349.0)
 
         nStars = 10
-        raList = (numpy.random.random_sample(nStars)-0.5) + ra0
-        decList = (numpy.random.random_sample(nStars)-0.5) + dec0
+        raList = (self.rng.random(nStars)-0.5) + ra0
+        decList = (self.rng.random(nStars)-0.5) + dec0
         xPupList, yPupList = pupilCoordsFromRaDec(raList, decList,
                                                   obs_metadata=obs,
                                                   epoch=2000.0)
@@ -926,7 +922,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
         # in a camera
         with self.assertRaises(RuntimeError) as context:
             xf, yf = focalPlaneCoordsFromPupilCoords(xPupList, yPupList)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You cannot calculate focal plane coordinates " \
                          + "without specifying a camera")
 
@@ -934,7 +930,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
             xf, yf = focalPlaneCoordsFromRaDec(raList, decList,
                                                obs_metadata=obs,
                                                epoch=2000.0)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You cannot calculate focal plane coordinates " \
                          + "without specifying a camera")
 
@@ -942,7 +938,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
             xf, yf = _focalPlaneCoordsFromRaDec(raList, decList,
                                                 obs_metadata=obs,
                                                 epoch=2000.0)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You cannot calculate focal plane coordinates " \
                          + "without specifying a camera")
 
@@ -952,14 +948,14 @@ class FocalPlaneCoordTest(unittest.TestCase):
         with self.assertRaises(RuntimeError) as context:
             xf, yf = focalPlaneCoordsFromPupilCoords(list(xPupList), yPupList,
                                                      camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You must pass numpy arrays of xPupil and yPupil " \
                          +"to focalPlaneCoordsFromPupilCoords")
 
         with self.assertRaises(RuntimeError) as context:
             xf, yf = focalPlaneCoordsFromPupilCoords(xPupList, list(yPupList),
                                                      camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You must pass numpy arrays of xPupil and yPupil " \
                          +"to focalPlaneCoordsFromPupilCoords")
 
@@ -969,7 +965,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
                                                 obs_metadata=obs,
                                                 epoch=2000.0,
                                                 camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You must pass numpy arrays of RA and Dec to " \
                          + "focalPlaneCoordsFromRaDec")
 
@@ -978,7 +974,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
                                                 obs_metadata=obs,
                                                 epoch=2000.0,
                                                 camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You must pass numpy arrays of RA and Dec to " \
                          + "focalPlaneCoordsFromRaDec")
         # we do not have to run the test above on focalPlaneCoordsFromRaDec
@@ -990,7 +986,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
         with self.assertRaises(RuntimeError) as context:
             xf, yf = focalPlaneCoordsFromPupilCoords(xPupList, yPupList[0:4],
                                                      camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You specified 10 xPupil and 4 yPupil coordinates " \
                          + "in focalPlaneCoordsFromPupilCoords")
 
@@ -999,7 +995,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
                                                obs_metadata=obs,
                                                epoch=2000.0,
                                                camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You specified 10 RAs and 4 Decs in " \
                          + "focalPlaneCoordsFromRaDec")
 
@@ -1008,7 +1004,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
                                                 obs_metadata=obs,
                                                 epoch=2000.0,
                                                 camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You specified 10 RAs and 4 Decs in " \
                          + "focalPlaneCoordsFromRaDec")
 
@@ -1019,7 +1015,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
             xf, yf = focalPlaneCoordsFromRaDec(raList, decList,
                                                obs_metadata=obs,
                                                camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You have to specify an epoch to run " \
                          + "focalPlaneCoordsFromRaDec")
 
@@ -1027,7 +1023,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
             xf, yf = _focalPlaneCoordsFromRaDec(raList, decList,
                                                 obs_metadata=obs,
                                                 camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You have to specify an epoch to run " \
                          + "focalPlaneCoordsFromRaDec")
 
@@ -1038,7 +1034,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
             xf, yf = focalPlaneCoordsFromRaDec(raList, decList,
                                                epoch=2000.0,
                                                camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You have to specify an ObservationMetaData to run " \
                          + "focalPlaneCoordsFromRaDec")
 
@@ -1046,7 +1042,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
             xf, yf = _focalPlaneCoordsFromRaDec(raList, decList,
                                                 epoch=2000.0,
                                                 camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You have to specify an ObservationMetaData to run " \
                          + "focalPlaneCoordsFromRaDec")
 
@@ -1060,7 +1056,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
                                                obs_metadata=obsDummy,
                                                epoch=2000.0,
                                                camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You need to pass an ObservationMetaData with an " \
                          + "mjd into focalPlaneCoordsFromRaDec")
 
@@ -1069,7 +1065,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
                                                 obs_metadata=obsDummy,
                                                 epoch=2000.0,
                                                 camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You need to pass an ObservationMetaData with an " \
                          + "mjd into focalPlaneCoordsFromRaDec")
 
@@ -1082,7 +1078,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
                                                obs_metadata=obsDummy,
                                                epoch=2000.0,
                                                camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You need to pass an ObservationMetaData with a " \
                          + "rotSkyPos into focalPlaneCoordsFromRaDec")
 
@@ -1091,7 +1087,7 @@ class FocalPlaneCoordTest(unittest.TestCase):
                                                 obs_metadata=obsDummy,
                                                 epoch=2000.0,
                                                 camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You need to pass an ObservationMetaData with a " \
                          + "rotSkyPos into focalPlaneCoordsFromRaDec")
 
@@ -1174,12 +1170,10 @@ class ConversionFromPixelTest(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cameraDir = getPackageDir('sims_coordUtils')
-        cameraDir = os.path.join(cameraDir, 'tests', 'cameraData')
-        cls.camera = ReturnCamera(cameraDir)
+        cls.camera = _cachedCamera(_CAMERA_DIR)
 
     def setUp(self):
-        numpy.random.seed(543)
+        self.rng = numpy.random.default_rng(543)
 
     def testPupCoordsException(self):
         """
@@ -1187,13 +1181,13 @@ class ConversionFromPixelTest(unittest.TestCase):
         call it without a camera
         """
         nStars = 100
-        xPupList = radiansFromArcsec((numpy.random.random_sample(nStars)-0.5)*320.0)
-        yPupList = radiansFromArcsec((numpy.random.random_sample(nStars)-0.5)*320.0)
+        xPupList = radiansFromArcsec((self.rng.random(nStars)-0.5)*320.0)
+        yPupList = radiansFromArcsec((self.rng.random(nStars)-0.5)*320.0)
         chipNameList = chipNameFromPupilCoords(xPupList, yPupList, camera=self.camera)
         xPix, yPix = pixelCoordsFromPupilCoords(xPupList, yPupList, camera=self.camera)
         with self.assertRaises(RuntimeError) as context:
             xPupTest, yPupTest = pupilCoordsFromPixelCoords(xPix, yPix, chipNameList)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You cannot call pupilCoordsFromPixelCoords without specifying " \
                          + "a camera")
 
@@ -1205,8 +1199,8 @@ class ConversionFromPixelTest(unittest.TestCase):
         """
 
         nStars = 100
-        xPupList = radiansFromArcsec((numpy.random.random_sample(nStars)-0.5)*320.0)
-        yPupList = radiansFromArcsec((numpy.random.random_sample(nStars)-0.5)*320.0)
+        xPupList = radiansFromArcsec((self.rng.random(nStars)-0.5)*320.0)
+        yPupList = radiansFromArcsec((self.rng.random(nStars)-0.5)*320.0)
         chipNameList = chipNameFromPupilCoords(xPupList, yPupList, camera=self.camera)
         for includeDistortion in [True, False]:
             xPix, yPix = pixelCoordsFromPupilCoords(xPupList, yPupList, camera=self.camera,
@@ -1230,8 +1224,8 @@ class ConversionFromPixelTest(unittest.TestCase):
         Test that points which do not have a chip return NaN for pupilCoordsFromPixelCoords
         """
         nStars = 10
-        xPupList = radiansFromArcsec((numpy.random.random_sample(nStars)-0.5)*320.0)
-        yPupList = radiansFromArcsec((numpy.random.random_sample(nStars)-0.5)*320.0)
+        xPupList = radiansFromArcsec((self.rng.random(nStars)-0.5)*320.0)
+        yPupList = radiansFromArcsec((self.rng.random(nStars)-0.5)*320.0)
         chipNameList = chipNameFromPupilCoords(xPupList, yPupList, camera=self.camera)
         chipNameList[5] = None
         xPix, yPix = pixelCoordsFromPupilCoords(xPupList, yPupList, camera=self.camera)
@@ -1250,50 +1244,50 @@ class ConversionFromPixelTest(unittest.TestCase):
         obs = ObservationMetaData(pointingRA=ra0, pointingDec=dec0,
                                   mjd=43525.0, rotSkyPos=145.0)
 
-        xPixList = numpy.random.random_sample(nStars)*4000.0
-        yPixList = numpy.random.random_sample(nStars)*4000.0
+        xPixList = self.rng.random(nStars)*4000.0
+        yPixList = self.rng.random(nStars)*4000.0
 
-        chipDexList = numpy.random.random_integers(0, len(self.camera)-1, nStars)
-        chipNameList = [self.camera[self.camera._nameDetectorDict.keys()[ii]].getName() for ii in chipDexList]
+        chipDexList = self.rng.integers(0, len(self.camera), nStars)
+        chipNameList = [self.camera[list(self.camera._nameDetectorDict.keys())[ii]].getName() for ii in chipDexList]
 
         # test that an error is raised if you do not pass in a camera
         with self.assertRaises(RuntimeError) as context:
             ra, dec = raDecFromPixelCoords(xPixList, yPixList, chipNameList,
                                            obs_metadata=obs, epoch=2000.0)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You cannot call raDecFromPixelCoords without specifying a camera")
 
         with self.assertRaises(RuntimeError) as context:
             ra, dec = _raDecFromPixelCoords(xPixList, yPixList, chipNameList,
                                             obs_metadata=obs, epoch=2000.0)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You cannot call raDecFromPixelCoords without specifying a camera")
 
         # test that an error is raised if you do not pass in an epoch
         with self.assertRaises(RuntimeError) as context:
             ra, dec = raDecFromPixelCoords(xPixList, yPixList, chipNameList,
                                            obs_metadata=obs, camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You cannot call raDecFromPixelCoords without specifying an epoch")
 
         with self.assertRaises(RuntimeError) as context:
             ra, dec = _raDecFromPixelCoords(xPixList, yPixList, chipNameList,
                                             obs_metadata=obs, camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You cannot call raDecFromPixelCoords without specifying an epoch")
 
         # test that an error is raised if you do not pass in an ObservationMetaData
         with self.assertRaises(RuntimeError) as context:
             ra, dec = raDecFromPixelCoords(xPixList, yPixList, chipNameList,
                                            epoch=2000.0, camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You cannot call raDecFromPixelCoords without an ObservationMetaData")
 
         # test that an error is raised if you do not pass in an ObservationMetaData
         with self.assertRaises(RuntimeError) as context:
             ra, dec = _raDecFromPixelCoords(xPixList, yPixList, chipNameList,
                                             epoch=2000.0, camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You cannot call raDecFromPixelCoords without an ObservationMetaData")
 
         # test that an error is raised if you pass in an ObservationMetaData
@@ -1303,14 +1297,14 @@ class ConversionFromPixelTest(unittest.TestCase):
             ra, dec = raDecFromPixelCoords(xPixList, yPixList, chipNameList,
                                            obs_metadata=obsDummy,
                                            epoch=2000.0, camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "The ObservationMetaData in raDecFromPixelCoords must have an mjd")
 
         with self.assertRaises(RuntimeError) as context:
             ra, dec = _raDecFromPixelCoords(xPixList, yPixList, chipNameList,
                                             obs_metadata=obsDummy,
                                             epoch=2000.0, camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "The ObservationMetaData in raDecFromPixelCoords must have an mjd")
 
 
@@ -1321,49 +1315,51 @@ class ConversionFromPixelTest(unittest.TestCase):
             ra, dec = raDecFromPixelCoords(xPixList, yPixList, chipNameList,
                                            obs_metadata=obsDummy,
                                            epoch=2000.0, camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "The ObservationMetaData in raDecFromPixelCoords must have a rotSkyPos")
 
         with self.assertRaises(RuntimeError) as context:
             ra, dec = _raDecFromPixelCoords(xPixList, yPixList, chipNameList,
                                             obs_metadata=obsDummy,
                                             epoch=2000.0, camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "The ObservationMetaData in raDecFromPixelCoords must have a rotSkyPos")
 
 
         # test that an error is raised if you pass in lists of pixel coordinates,
         # rather than numpy arrays
+        xPixListPy = xPixList.tolist()
+        yPixListPy = yPixList.tolist()
         with self.assertRaises(RuntimeError) as context:
-            ra, dec = raDecFromPixelCoords(list(xPixList), yPixList,
+            ra, dec = raDecFromPixelCoords(xPixListPy, yPixList,
                                            chipNameList, obs_metadata=obs,
                                            epoch=2000.0, camera=self.camera)
 
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You must pass numpy arrays of xPix and yPix to raDecFromPixelCoords")
 
         with self.assertRaises(RuntimeError) as context:
-            ra, dec = raDecFromPixelCoords(xPixList, list(yPixList),
+            ra, dec = raDecFromPixelCoords(xPixList, yPixListPy,
                                            chipNameList, obs_metadata=obs,
                                            epoch=2000.0, camera=self.camera)
 
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You must pass numpy arrays of xPix and yPix to raDecFromPixelCoords")
 
         with self.assertRaises(RuntimeError) as context:
-            ra, dec = _raDecFromPixelCoords(list(xPixList), yPixList,
+            ra, dec = _raDecFromPixelCoords(xPixListPy, yPixList,
                                             chipNameList, obs_metadata=obs,
                                             epoch=2000.0, camera=self.camera)
 
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You must pass numpy arrays of xPix and yPix to raDecFromPixelCoords")
 
         with self.assertRaises(RuntimeError) as context:
-            ra, dec = _raDecFromPixelCoords(xPixList, list(yPixList),
+            ra, dec = _raDecFromPixelCoords(xPixList, yPixListPy,
                                             chipNameList, obs_metadata=obs,
                                             epoch=2000.0, camera=self.camera)
 
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You must pass numpy arrays of xPix and yPix to raDecFromPixelCoords")
 
 
@@ -1372,14 +1368,14 @@ class ConversionFromPixelTest(unittest.TestCase):
         with self.assertRaises(RuntimeError) as context:
             ra, dec = raDecFromPixelCoords(xPixList, yPixList[0:13], chipNameList,
                                            obs_metadata=obs, epoch=2000.0, camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You passed 20 xPix coordinates but 13 yPix coordinates "\
                          + "to raDecFromPixelCoords")
 
         with self.assertRaises(RuntimeError) as context:
             ra, dec = _raDecFromPixelCoords(xPixList, yPixList[0:13], chipNameList,
                                             obs_metadata=obs, epoch=2000.0, camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You passed 20 xPix coordinates but 13 yPix coordinates "\
                          + "to raDecFromPixelCoords")
 
@@ -1388,14 +1384,14 @@ class ConversionFromPixelTest(unittest.TestCase):
         with self.assertRaises(RuntimeError) as context:
             ra, dec = raDecFromPixelCoords(xPixList, yPixList, ['Det22']*22,
                                            obs_metadata=obs, epoch=2000.0, camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You passed 20 pixel coordinate pairs but 22 chip names to "\
                          + "raDecFromPixelCoords")
 
         with self.assertRaises(RuntimeError) as context:
             ra, dec = _raDecFromPixelCoords(xPixList, yPixList, ['Det22']*22,
                                             obs_metadata=obs, epoch=2000.0, camera=self.camera)
-        self.assertEqual(context.exception.message,
+        self.assertEqual(str(context.exception),
                          "You passed 20 pixel coordinate pairs but 22 chip names to "\
                          + "raDecFromPixelCoords")
 
@@ -1411,11 +1407,11 @@ class ConversionFromPixelTest(unittest.TestCase):
         obs = ObservationMetaData(pointingRA=ra0, pointingDec=dec0,
                                   mjd=43525.0, rotSkyPos=145.0)
 
-        xPixList = numpy.random.random_sample(nStars)*4000.0
-        yPixList = numpy.random.random_sample(nStars)*4000.0
+        xPixList = self.rng.random(nStars)*4000.0
+        yPixList = self.rng.random(nStars)*4000.0
 
-        chipDexList = numpy.random.random_integers(0, len(self.camera)-1, nStars)
-        chipNameList = [self.camera[self.camera._nameDetectorDict.keys()[ii]].getName() for ii in chipDexList]
+        chipDexList = self.rng.integers(0, len(self.camera), nStars)
+        chipNameList = [self.camera[list(self.camera._nameDetectorDict.keys())[ii]].getName() for ii in chipDexList]
 
         for includeDistortion in [True, False]:
 
@@ -1466,11 +1462,11 @@ class ConversionFromPixelTest(unittest.TestCase):
         obs = ObservationMetaData(pointingRA=ra0, pointingDec=dec0,
                                   mjd=43525.0, rotSkyPos=145.0)
 
-        xPixList = numpy.random.random_sample(nStars)*4000.0 + 4000.0
-        yPixList = numpy.random.random_sample(nStars)*4000.0 + 4000.0
+        xPixList = self.rng.random(nStars)*4000.0 + 4000.0
+        yPixList = self.rng.random(nStars)*4000.0 + 4000.0
 
-        chipDexList = numpy.random.random_integers(0, len(self.camera)-1, nStars)
-        chipNameList = [self.camera[self.camera._nameDetectorDict.keys()[ii]].getName() for ii in chipDexList]
+        chipDexList = self.rng.integers(0, len(self.camera), nStars)
+        chipNameList = [self.camera[list(self.camera._nameDetectorDict.keys())[ii]].getName() for ii in chipDexList]
 
         for includeDistortion in [True, False]:
 
@@ -1518,11 +1514,11 @@ class ConversionFromPixelTest(unittest.TestCase):
         If we take that away, the test will no longer pass.
         """
         nStars = 200
-        xPixList = numpy.random.random_sample(nStars)*4000.0 + 4000.0
-        yPixList = numpy.random.random_sample(nStars)*4000.0 + 4000.0
+        xPixList = self.rng.random(nStars)*4000.0 + 4000.0
+        yPixList = self.rng.random(nStars)*4000.0 + 4000.0
 
-        chipDexList = numpy.random.random_integers(0, len(self.camera)-1, nStars)
-        chipNameList = [self.camera[self.camera._nameDetectorDict.keys()[ii]].getName() for ii in chipDexList]
+        chipDexList = self.rng.integers(0, len(self.camera), nStars)
+        chipNameList = [self.camera[list(self.camera._nameDetectorDict.keys())[ii]].getName() for ii in chipDexList]
 
         xu, yu = pupilCoordsFromPixelCoords(xPixList, yPixList, chipNameList, camera=self.camera,
                                             includeDistortion=False)
@@ -1540,8 +1536,19 @@ class ConversionFromPixelTest(unittest.TestCase):
 
 
 
+_INITIALIZED = False
+
 def suite():
-    utilsTests.init()
+    # utilsTests.init() only needs to run once no matter how many times
+    # run() is invoked; the suite itself must be rebuilt per call because
+    # TestSuite.run discards each test after executing it on Python 3
+    import lsst.utils.tests as utilsTests
+
+    global _INITIALIZED
+    if not _INITIALIZED:
+        utilsTests.init()
+        _INITIALIZED = True
+
     suites = []
     suites += unittest.makeSuite(ChipNameTest)
     suites += unittest.makeSuite(PixelCoordTest)
@@ -1550,6 +1557,7 @@ def suite():
     return unittest.TestSuite(suites)
 
 def run(shouldExit=False):
+    import lsst.utils.tests as utilsTests
     utilsTests.run(suite(),shouldExit)
 
 if __name__ == "__main__":